@@ -0,0 +1,247 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# SymmetricCalendar - The Symmetry454 Calendar in Python
+#
+# Copyright (C) 2023–
+# Copyright (C) Ari Caldeira <aricaldeira at gmail.com>
+#
+# Original calendar documentation is Public Domain by it’s author:
+# http://individual.utoronto.ca/kalendis/symmetry.htm
+#
+
+#
+# The integer arithmetic behind every ordinal ↔ year, month, day conversion.
+#
+# These functions run as plain Python, and the per year results
+# (leap or not, days before the year) and the per day results
+# (year, month and day of an ordinal) come from tables
+# precomputed at import time.
+#
+# Numba can compile them to native code instead, but only when asked for,
+# with SYMMETRIC_CALENDAR_NUMBA=1 in the environment: each call to a compiled
+# function goes through Numba’s dispatcher, which, for a single date,
+# costs more than the table lookups, and compiling slows down the import.
+#
+# Only integers cross the boundary, so no floor/ceil of floats here:
+#
+#   floor(a / b) → a // b
+#   ceil(a / b)  → (a + b - 1) // b
+#
+import array
+import os
+
+NUMBA = False
+
+if os.environ.get('SYMMETRIC_CALENDAR_NUMBA', '0') != '0':
+    try:
+        from numba import njit
+
+        NUMBA = True
+
+    except ImportError:
+        pass
+
+if not NUMBA:
+    def njit(*args, **kwargs):
+        def decorator(function):
+            return function
+
+        return decorator
+
+
+__all__ = ()
+
+
+EPOCH = 1
+
+#
+# Every year is made of whole weeks, and the 293 years cycle has 52 leap weeks,
+# so (293 × 52) + 52 = 15_288 weeks; the weeks before a year are then
+#
+#   (52 × (year - 1)) + floor(((52 × (year - 1)) + 146) / 293)
+#   = floor(((15_288 × (year - 1)) + 146) / 293)
+#
+# and, as this is a floor of a linear function, it can be inverted exactly
+#
+CYCLE_WEEKS = (293 * 52) + 52
+CYCLE_DAYS = CYCLE_WEEKS * 7
+
+#
+# Same as DAYS_BEFORE_MONTH, as a tuple, so Numba can use it as a constant
+#
+_DAYS_BEFORE_MONTH = (-1, 0, 28, 63, 91, 119, 154, 182, 210, 245, 273, 301, 336)
+
+
+@njit('i8(i8, b1)', cache=True)
+def _is_leap(year, holocene):
+    "year -> 7 if leap year, else 0."
+
+    #
+    # The different factor for the Holocene Epoch ensures
+    # that the same years are considered leap, using either
+    # Epoch
+    #
+    if holocene:
+        factor = 221
+    else:
+        factor = 146
+
+    return 7 if (((year * 52) + factor) % 293) < 52 else 0
+
+
+@njit('i8(i8, b1)', cache=True)
+def _days_before_year(year, holocene):
+    "year -> number of days before January 1st of year."
+    year -= 1
+
+    if holocene:
+        factor = 221
+    else:
+        factor = 146
+
+    return (364 * year) + (7 * (((52 * year) + factor) // 293))
+
+
+@njit('i8(i8, i8, i8, b1)', cache=True)
+def _year_month_day_to_ordinal(year, month, day, holocene):
+    "year, month, day -> ordinal, considering 01-Jan-0001 as day 1."
+    ordinal_date = _days_before_year(year, holocene)
+    ordinal_date += _DAYS_BEFORE_MONTH[month]
+    ordinal_date += day
+
+    return ordinal_date
+
+
+@njit('i8(i8)', cache=True)
+def _first_day_year(year):
+    return _days_before_year(year, False) + 1
+
+
+@njit('i8(i8)', cache=True)
+def _ordinal_to_year(ordinal_date):
+    "ordinal -> year."
+    week = (ordinal_date - EPOCH) // 7
+    return (((293 * week) + 146) // CYCLE_WEEKS) + 1
+
+
+@njit('UniTuple(i8, 5)(i8, b1)', cache=True)
+def _ordinal_to_year_month_day(ordinal_date, holocene):
+    #
+    # First, we find the year corresponding to the ordinal date;
+    # it is exact, so there is no estimate to correct
+    #
+    year = _ordinal_to_year(ordinal_date)
+    first_day_year = _first_day_year(year)
+
+    day_in_year = ordinal_date - first_day_year + 1
+    week_in_year = (day_in_year + 6) // 7
+    quarter = ((4 * week_in_year) + 52) // 53
+    day_in_quarter = day_in_year - (91 * (quarter - 1))
+    week_in_quarter = (day_in_quarter + 6) // 7
+    month_in_quarter = ((2 * week_in_quarter) + 8) // 9
+    month = (3 * (quarter - 1)) + month_in_quarter
+
+    #
+    # The day is in the leap week
+    #
+    if month == 13:
+        month = 12
+
+    day = day_in_year - _DAYS_BEFORE_MONTH[month]
+
+    #
+    # The ordinal date is always counted from the Common Era epoch,
+    # so the Holocene year is only adjusted at the end
+    #
+    if holocene:
+        year += 10_000
+
+    return year, month, day, day_in_year, week_in_year
+
+
+if not NUMBA:
+    #
+    # The tables go from year -10_000 to 9_999, so that
+    # Common Era year Y is at index Y + 10_000, covering every year
+    # the conversions above may ask for, including negative ordinals;
+    #
+    # Holocene year Y is leap when Common Era year Y - 10_000 is,
+    # so it is at index Y, and there are 3_652_425 more days before it
+    # (the days from 00_001-01-01 HOLOCENE to 0_001-01-01);
+    #
+    # anything outside the tables is still computed
+    #
+    _TABLE_YEARS = 20_000
+    _HOLOCENE_DAYS = 3_652_425
+
+    _IS_LEAP = bytes(_is_leap(year, False) for year in range(-10_000, 10_000))
+    _DAYS_BEFORE_YEAR = array.array('q', (_days_before_year(year, False) for year in range(-10_000, 10_000)))
+
+    _compute_is_leap = _is_leap
+    _compute_days_before_year = _days_before_year
+
+    def _is_leap(year, holocene):
+        "year -> 7 if leap year, else 0."
+        index = year if holocene else year + 10_000
+
+        if 0 <= index < _TABLE_YEARS:
+            return _IS_LEAP[index]
+
+        return _compute_is_leap(year, holocene)
+
+    def _days_before_year(year, holocene):
+        "year -> number of days before January 1st of year."
+        if holocene:
+            if 0 <= year < _TABLE_YEARS:
+                return _DAYS_BEFORE_YEAR[year] + _HOLOCENE_DAYS
+
+        elif -10_000 <= year < 10_000:
+            return _DAYS_BEFORE_YEAR[year + 10_000]
+
+        return _compute_days_before_year(year, holocene)
+
+    #
+    # The calendar repeats itself every 293 years, or 107_016 days, so
+    # for each day of the cycle, its year in the cycle and its day in that year;
+    # and, for each day in a year, its month and its day in that month
+    #
+    _CYCLE_YEAR = array.array('H')
+    _CYCLE_DAY_IN_YEAR = array.array('H')
+
+    for year in range(293):
+        days_in_year = _days_before_year(year + 2, False) - _days_before_year(year + 1, False)
+        _CYCLE_YEAR.extend([year] * days_in_year)
+        _CYCLE_DAY_IN_YEAR.extend(range(1, days_in_year + 1))
+
+    _MONTH_OF_DAY_IN_YEAR = bytearray([0])
+    _DAY_OF_DAY_IN_YEAR = bytearray([0])
+
+    for month, days_in_month in enumerate((28, 35, 28, 28, 35, 28, 28, 35, 28, 28, 35, 35), 1):
+        _MONTH_OF_DAY_IN_YEAR.extend([month] * days_in_month)
+        _DAY_OF_DAY_IN_YEAR.extend(range(1, days_in_month + 1))
+
+    _MONTH_OF_DAY_IN_YEAR = bytes(_MONTH_OF_DAY_IN_YEAR)
+    _DAY_OF_DAY_IN_YEAR = bytes(_DAY_OF_DAY_IN_YEAR)
+
+    del year, days_in_year, month, days_in_month
+
+    def _ordinal_to_year_month_day(ordinal_date, holocene):
+        day_in_cycle = (ordinal_date - EPOCH) % CYCLE_DAYS
+        day_in_year = _CYCLE_DAY_IN_YEAR[day_in_cycle]
+        year = (((ordinal_date - EPOCH) // CYCLE_DAYS) * 293) + _CYCLE_YEAR[day_in_cycle] + 1
+
+        #
+        # The ordinal date is always counted from the Common Era epoch,
+        # so the Holocene year is only adjusted at the end
+        #
+        if holocene:
+            year += 10_000
+
+        return (
+            year,
+            _MONTH_OF_DAY_IN_YEAR[day_in_year],
+            _DAY_OF_DAY_IN_YEAR[day_in_year],
+            day_in_year,
+            (day_in_year + 6) // 7,
+        )
@@ -13,9 +13,29 @@
 __all__ = ('SymmetricDate', 'POSIX_EPOCH')
 
 import time as _time
-import math
 import datetime as _datetime
 import locale
+import re
+
+from collections import OrderedDict
+from functools import lru_cache
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+#
+# Run as a script (the demo below), there is no package to import from
+#
+try:
+    from ._kernels import _is_leap, _year_month_day_to_ordinal, _ordinal_to_year_month_day, \
+        CYCLE_WEEKS as _CYCLE_WEEKS
+
+except ImportError:
+    from _kernels import _is_leap, _year_month_day_to_ordinal, _ordinal_to_year_month_day, \
+        CYCLE_WEEKS as _CYCLE_WEEKS
 
 
 #
@@ -41,8 +61,6 @@ EPOCH = 1
 HOLOCENE_MAXYEAR = 19_998
 HOLOCENE_EPOCH = -3_652_424
 
-CYCLE_MEAN_YEAR = 365 + (71 / 293)
-
 #
 # 1_970-01-04 SYMMETRIC → 1_970-01-01 GREGORIAN → 719_163
 # (11_970-01-04 HOLOCENE SYMMETRIC)
@@ -52,169 +70,242 @@ POSIX_EPOCH = 719_163
 #
 # -1 is just a placeholder, so we don’t need to worry about month number 0
 #
-DAYS_IN_MONTH = [-1, 28, 35, 28, 28, 35, 28, 28, 35, 28, 28, 35, 28]
-DAYS_BEFORE_MONTH = [-1]
+# Both are tuples: immutable, and indexed just as fast as lists;
+# bytes and array.array are 2 to 3 times slower to index on CPython
+#
+DAYS_IN_MONTH = (-1, 28, 35, 28, 28, 35, 28, 28, 35, 28, 28, 35, 28)
+DAYS_BEFORE_MONTH = (-1, 0, 28, 63, 91, 119, 154, 182, 210, 245, 273, 301, 336)
 
-days_before_month = 0
 
-for days_in_month in DAYS_IN_MONTH[1:]:
-    DAYS_BEFORE_MONTH.append(days_before_month)
-    days_before_month += days_in_month
+def _days_in_month(year, month, holocene=False):
+    "year, month -> number of days in that month in that year."
+    assert 1 <= month <= 12, month
 
-del days_before_month, days_in_month
+    if month == 12 and _is_leap(year, holocene):
+        return 35
 
+    return DAYS_IN_MONTH[month]
 
-def _is_leap(year, holocene=False):
-    "year -> 7 if leap year, else 0."
 
-    #
-    # The different factor for the Holocene Epoch ensures
-    # that the same years are considered leap, using either
-    # Epoch
-    #
+def _check_date_fields(year, month, day, holocene=False):
     if holocene:
-        factor = 221
-    else:
-        factor = 146
-
-    return 7 if (((year * 52) + factor) % 293) < 52 else 0
+        if not MINYEAR <= year <= HOLOCENE_MAXYEAR:
+            raise ValueError('Year must be in %d..%d' % (MINYEAR, HOLOCENE_MAXYEAR), year)
 
+    else:
+        if not MINYEAR <= year <= MAXYEAR:
+            raise ValueError('Year must be in %d..%d' % (MINYEAR, MAXYEAR), year)
 
-def _days_before_year(year, holocene=False):
-    "year -> number of days before January 1st of year."
-    year -= 1
+    if not 1 <= month <= 12:
+        raise ValueError('Month must be in 1..12', month)
 
     #
-    # The different factor for the Holocene Epoch ensures
-    # that the same years are considered leap, using either
-    # Epoch
+    # Every month has at least 28 days, so the length of the month,
+    # and whether the year is leap, is only needed after that
     #
-    if holocene:
-        factor = 221
-    else:
-        factor = 146
-
-    return (364 * year) + (7 * math.floor(((52 * year) + factor) / 293))
+    if not 1 <= day <= 28:
+        days_in_month = _days_in_month(year, month, holocene)
 
+        if not 1 <= day <= days_in_month:
+            raise ValueError('Day must be in 1..%d' % days_in_month, day)
 
-def _days_in_month(year, month, holocene=False):
-    "year, month -> number of days in that month in that year."
-    assert 1 <= month <= 12, month
-
-    if month == 12 and _is_leap(year, holocene):
-        return 35
-
-    return DAYS_IN_MONTH[month]
-
+    return year, month, day
 
-def _days_before_month(month):
-    "year, month -> number of days in year preceding first day of month."
-    assert 1 <= month <= 12, 'month must be in 1..12'
 
-    return DAYS_BEFORE_MONTH[month]
+#
+# SymmetricDate is immutable, so the most recently built dates
+# are kept and shared, instead of being built again
+#
+_INSTANCE_CACHE = OrderedDict()
+_INSTANCE_CACHE_SIZE = 4_096
 
 
-def _year_month_day_to_ordinal(year, month, day, holocene=False):
-    "year, month, day -> ordinal, considering 01-Jan-0001 as day 1."
-    assert 1 <= month <= 12, 'month must be in 1..12'
+#
+# Vectorized counterparts of the kernels, working on whole NumPy arrays
+#
+if np is not None:
+    _DAYS_IN_MONTH_ARRAY = np.array(DAYS_IN_MONTH, dtype=np.int64)
+    _DAYS_BEFORE_MONTH_ARRAY = np.array(DAYS_BEFORE_MONTH, dtype=np.int64)
 
-    days_in_month = _days_in_month(year, month, holocene)
 
-    assert 1 <= day <= days_in_month, ('day must be in 1..%d' % days_in_month)
+def _days_before_year_array(year, holocene=False):
+    "year array -> number of days before January 1st of each year."
+    year = year - 1
+    factor = 221 if holocene else 146
+    return (364 * year) + (7 * (((52 * year) + factor) // 293))
 
-    ordinal_date = _days_before_year(year, holocene)
-    ordinal_date += _days_before_month(month)
-    ordinal_date += day
 
-    return ordinal_date
+def _year_month_day_to_ordinal_array(year, month, day, holocene=False):
+    "year, month, day arrays -> ordinal array."
+    year = np.asarray(year, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    day = np.asarray(day, dtype=np.int64)
 
+    max_year = HOLOCENE_MAXYEAR if holocene else MAXYEAR
 
-def _first_day_year(year):
-    return _days_before_year(year) + 1
+    if np.any((year < MINYEAR) | (year > max_year)):
+        raise ValueError('Year must be in %d..%d' % (MINYEAR, max_year))
 
+    if np.any((month < 1) | (month > 12)):
+        raise ValueError('Month must be in 1..12')
 
-def _ordinal_to_year(ordinal_date):
-    year = ordinal_date - EPOCH
-    year /= CYCLE_MEAN_YEAR
-    year = math.ceil(year)
-    return year
+    days_in_month = _DAYS_IN_MONTH_ARRAY[month]
+    leap = ((year * 52) + (221 if holocene else 146)) % 293 < 52
+    days_in_month = np.where((month == 12) & leap, 35, days_in_month)
 
+    if np.any((day < 1) | (day > days_in_month)):
+        raise ValueError('Day out of range for month')
 
-def _ordinal_to_year_month_day(ordinal_date, holocene=False):
     #
-    # First, we find the year corresponding to the ordinal date
+    # Not in place, so that year, month and day broadcast against each other
     #
-    year = _ordinal_to_year(ordinal_date)
-
-    if holocene:
-        year += 10_000
+    ordinal_date = _days_before_year_array(year, holocene) + _DAYS_BEFORE_MONTH_ARRAY[month] + day
 
-    first_day_year = _first_day_year(year)
+    return ordinal_date
 
-    #
-    # We now check if the year is correct
-    # The start of the year is either on the year or we must increment the year
-    #
-    if ordinal_date > first_day_year:
-        #
-        # Check if the ordinal date informed may be
-        # on the leap week of December or the next year
-        #
-        if ordinal_date - first_day_year >= 364:
-            first_day_next_year = _first_day_year(year + 1)
 
-            #
-            # If the given ordinal date is after the next year’s first day,
-            # then it is on the next year
-            #
-            if ordinal_date >= first_day_next_year:
-                year += 1
-                first_day_year = first_day_next_year
+def _ordinal_to_year_month_day_array(ordinal_date, holocene=False):
+    "ordinal array -> structured array of year, month, day, day_in_year, week_in_year."
+    ordinal_date = np.asarray(ordinal_date, dtype=np.int64)
 
     #
-    # The year estimate is too far in the future, go back 1 year
+    # Same exact, week based, year as the scalar version,
+    # so there are no corrections to mask
     #
-    elif first_day_year > ordinal_date:
-        year -= 1
-        first_day_year = _first_day_year(year)
+    week = (ordinal_date - EPOCH) // 7
+    year = (((293 * week) + 146) // _CYCLE_WEEKS) + 1
+    first_day_year = _days_before_year_array(year) + 1
 
     day_in_year = ordinal_date - first_day_year + 1
-    week_in_year = math.ceil(day_in_year / 7)
-    quarter = math.ceil((4 / 53) *  week_in_year)
+    week_in_year = (day_in_year + 6) // 7
+    quarter = ((4 * week_in_year) + 52) // 53
     day_in_quarter = day_in_year - (91 * (quarter - 1))
-    week_in_quarter = math.ceil(day_in_quarter / 7)
-    month_in_quarter = math.ceil((2 / 9) * week_in_quarter)
-    month = (3 * (quarter - 1)) + month_in_quarter
+    week_in_quarter = (day_in_quarter + 6) // 7
+    month_in_quarter = ((2 * week_in_quarter) + 8) // 9
 
     #
-    # The day is in the leap week
+    # The leap week is still December
     #
-    if month == 13:
-        month = 12
+    month = np.minimum((3 * (quarter - 1)) + month_in_quarter, 12)
+    day = day_in_year - _DAYS_BEFORE_MONTH_ARRAY[month]
 
-    day = day_in_year - _days_before_month(month)
+    if holocene:
+        year += 10_000
 
-    return year, month, day, day_in_year, week_in_year
+    result = np.empty(ordinal_date.shape, dtype=[
+        ('year', np.int64),
+        ('month', np.int64),
+        ('day', np.int64),
+        ('day_in_year', np.int64),
+        ('week_in_year', np.int64),
+    ])
+    result['year'] = year
+    result['month'] = month
+    result['day'] = day
+    result['day_in_year'] = day_in_year
+    result['week_in_year'] = week_in_year
 
+    return result
 
-def _check_date_fields(year, month, day, holocene=False):
-    if holocene:
-        if not MINYEAR <= year <= HOLOCENE_MAXYEAR:
-            raise ValueError('Year must be in %d..%d' % (MINYEAR, HOLOCENE_MAXYEAR), year)
 
-    else:
-        if not MINYEAR <= year <= MAXYEAR:
-            raise ValueError('Year must be in %d..%d' % (MINYEAR, MAXYEAR), year)
+#
+# nl_langinfo codes of the weekday names, Monday first,
+# and of the month names
+#
+try:
+    _ABDAY = (
+        locale.ABDAY_2, locale.ABDAY_3, locale.ABDAY_4, locale.ABDAY_5,
+        locale.ABDAY_6, locale.ABDAY_7, locale.ABDAY_1,
+    )
+    _DAY = (
+        locale.DAY_2, locale.DAY_3, locale.DAY_4, locale.DAY_5,
+        locale.DAY_6, locale.DAY_7, locale.DAY_1,
+    )
+    _ABMON = (
+        locale.ABMON_1, locale.ABMON_2, locale.ABMON_3, locale.ABMON_4,
+        locale.ABMON_5, locale.ABMON_6, locale.ABMON_7, locale.ABMON_8,
+        locale.ABMON_9, locale.ABMON_10, locale.ABMON_11, locale.ABMON_12,
+    )
+    _MON = (
+        locale.MON_1, locale.MON_2, locale.MON_3, locale.MON_4,
+        locale.MON_5, locale.MON_6, locale.MON_7, locale.MON_8,
+        locale.MON_9, locale.MON_10, locale.MON_11, locale.MON_12,
+    )
 
-    if not 1 <= month <= 12:
-        raise ValueError('Month must be in 1..12', month)
+#
+# nl_langinfo is only available on Unix
+#
+except AttributeError:
+    _ABDAY = _DAY = _ABMON = _MON = ()
 
-    days_in_month = _days_in_month(year, month, holocene)
+#
+# strftime directives that are or may be different from the Gregorian Calendar;
+# anything else is left for the Gregorian date’s strftime
+#
+_STRFTIME_DIRECTIVES = {
+    '%%': lambda date: '%%',
+    '%a': lambda date: date._strftime_locale('%a'),
+    '%A': lambda date: date._strftime_locale('%A'),
+    '%d': lambda date: str(date._day).zfill(2),
+    '%-d': lambda date: str(date._day),
+    '%e': lambda date: str(date._day).rjust(2),
+    '%-e': lambda date: str(date._day),
+    '%o': lambda date: date._strftime_ordinal_suffix(),
+    '%m': lambda date: str(date._month).zfill(2),
+    '%-m': lambda date: str(date._month),
+    '%b': lambda date: date._strftime_locale('%b'),
+    '%h': lambda date: date._strftime_locale('%b'),
+    '%B': lambda date: date._strftime_locale('%B'),
+    '%y': lambda date: str(date._year % 100).zfill(2),
+    '%Y': lambda date: str(date._year),
+    '%EC': lambda date: date._strftime_locale('%EC'),
+    '%E': lambda date: date._strftime_locale('%E'),
+    '%j': lambda date: date._strftime_day_in_year().zfill(3),
+    '%-j': lambda date: date._strftime_day_in_year(),
+    '%w': lambda date: date._strftime_weekday_number(),
+    '%U': lambda date: date._strftime_week_in_year().zfill(2),
+    '%-U': lambda date: date._strftime_week_in_year(),
+    '%W': lambda date: date._strftime_week_in_year().zfill(2),
+    '%-W': lambda date: date._strftime_week_in_year(),
+    '%n': lambda date: '\n',
+    '%t': lambda date: '\t',
+}
 
-    if not 1 <= day <= days_in_month:
-        raise ValueError('Day must be in 1..%d' % days_in_month, day)
+#
+# A single pass over the format: %EC is tried before %E,
+# and the - flag is part of the directive
+#
+_STRFTIME_RE = re.compile(r'%(?:[%aAdeobhmBByYjwUWnt]|-[dejmUW]|EC?)')
 
-    return year, month, day
+#
+# Directives that stand for other directives are expanded first,
+# in their own pass, instead of calling strftime again for each one;
+# %% is matched too, so that %%c is left alone
+#
+_STRFTIME_TEMPLATES = {
+    '%%': lambda: '%%',
+    '%c': lambda: locale.nl_langinfo(locale.D_T_FMT),
+    '%x': lambda: locale.nl_langinfo(locale.D_FMT),
+    '%X': lambda: locale.nl_langinfo(locale.T_FMT),
+    '%D': lambda: '%m/%d/%y',
+    '%F': lambda: '%Y-%m-%d',
+}
+
+_STRFTIME_TEMPLATES_RE = re.compile(r'%[%cxXDF]')
+
+_STRFTIME_SPLIT_RE = re.compile(f'({_STRFTIME_RE.pattern})')
+
+
+@lru_cache(maxsize=256)
+def _compile_strftime(fmt):
+    "format -> has templates, ((literal, directive function), ...), trailing literal."
+    has_templates = any(match[0] != '%%' for match in _STRFTIME_TEMPLATES_RE.finditer(fmt))
+    parts = _STRFTIME_SPLIT_RE.split(fmt)
+    directives = tuple(
+        (parts[i], _STRFTIME_DIRECTIVES[parts[i + 1]])
+        for i in range(0, len(parts) - 1, 2)
+    )
+    return has_templates, directives, parts[-1]
 
 
 class SymmetricDate():
@@ -228,10 +319,20 @@ class SymmetricDate():
         year, month, day (required, base 1)
         """
         if month is None:
-            if type(year) in (_datetime.date, cls):
+            #
+            # Another SymmetricDate (or SymmetricDateTime) already knows its ordinal
+            # and year counting, as in SymmetricDateTime.__new__
+            #
+            if isinstance(year, SymmetricDate):
+                return cls._cached(year._year, year._month, year._day, year._ordinal_date, year._holocene)
+
+            #
+            # isinstance, so datetime.datetime is taken too
+            #
+            elif isinstance(year, _datetime.date):
                 return cls.fromordinal(year.toordinal(), holocene=holocene)
 
-            elif type(year) == str:
+            elif isinstance(year, str):
                 year, month, day = year.split('-')
                 year = int(year)
                 month = int(month)
@@ -239,22 +340,56 @@ class SymmetricDate():
 
         _check_date_fields(year, month, day, holocene)
 
+        return cls._cached(year, month, day, None, holocene)
+
+    @classmethod
+    def _cached(cls, year, month, day, ordinal_date, holocene):
+        "Already checked year, month, day and their ordinal (None when not known yet) -> shared date."
+        key = (cls, year, month, day, holocene)
+        self = _INSTANCE_CACHE.get(key)
+
+        if self is not None:
+            #
+            # Another thread may have evicted it in the meantime
+            #
+            try:
+                _INSTANCE_CACHE.move_to_end(key)
+            except KeyError:
+                pass
+
+            return self
+
+        #
+        # Only computed when the date is not already there
+        #
+        if ordinal_date is None:
+            ordinal_date = _year_month_day_to_ordinal(year, month, day, holocene)
+
+        self = cls._fromfields(year, month, day, ordinal_date, holocene)
+
+        _INSTANCE_CACHE[key] = self
+
+        if len(_INSTANCE_CACHE) > _INSTANCE_CACHE_SIZE:
+            _INSTANCE_CACHE.popitem(last=False)
+
+        return self
+
+    @classmethod
+    def _fromfields(cls, year, month, day, ordinal_date, holocene):
+        "Already checked year, month, day and their ordinal -> new date."
         self = object.__new__(cls)
         self._year = year
         self._month = month
         self._day = day
-        self._ordinal_date = _year_month_day_to_ordinal(year, month, day, holocene)
+        self._ordinal_date = ordinal_date
         self._hashcode = -1
         self._holocene = holocene
-        self._is_leap = _is_leap(year, holocene)
 
-        if not holocene:
-            self._gregorian_date = _datetime.date.fromordinal(self.toordinal())
-        else:
-            if year >= 10_001:
-                self._gregorian_date = _datetime.date.fromordinal(self.toordinal())
-            else:
-                self._gregorian_date = None
+        #
+        # Computed only when asked for, see is_leap and gregorian_date
+        #
+        self._is_leap = None
+        self._gregorian_date = None
 
         return self
 
@@ -263,9 +398,13 @@ class SymmetricDate():
     @classmethod
     def fromtimestamp(cls, timestamp, holocene=False):
         "Construct a date from a POSIX timestamp (like time.time())."
-        y, m, d, hh, mm, ss, weekday, jday, dst = _time.localtime(t)
-        x = _datetime.date(y, m, d)
-        return cls.fromordinal(x.toordinal(), holocene)
+        #
+        # Both calendars share the ordinals, so the local date
+        # is just the days since the POSIX epoch, after the UTC offset
+        #
+        offset = _time.localtime(timestamp).tm_gmtoff
+        ordinal_date = POSIX_EPOCH + int((timestamp + offset) // 86_400)
+        return cls.fromordinal(ordinal_date, holocene)
 
     def timestamp(self):
         ordinal_date = self.toordinal()
@@ -281,8 +420,51 @@ class SymmetricDate():
 
     @classmethod
     def fromordinal(cls, ordinal_date, holocene=False):
+        #
+        # Checked before the conversion, so that an ordinal too large
+        # for the kernels fails the same way as any other out of range;
+        # in range, year, month and day are always valid
+        #
+        min_ordinal = HOLOCENE_EPOCH if holocene else EPOCH
+
+        if not min_ordinal <= ordinal_date <= MAXORDINAL:
+            raise ValueError('Ordinal must be in %d..%d' % (min_ordinal, MAXORDINAL), ordinal_date)
+
         y, m, d, diy, wiy = _ordinal_to_year_month_day(ordinal_date, holocene)
-        return cls(y, m, d, holocene=holocene)
+
+        #
+        # Subclasses with their own constructor (SymmetricDateTime) go through it
+        #
+        if cls.__new__ is not SymmetricDate.__new__:
+            return cls(y, m, d, holocene=holocene)
+
+        #
+        # Holocene dates count their ordinals from 00_001-01-01 HOLOCENE
+        #
+        if holocene:
+            ordinal_date += EPOCH - HOLOCENE_EPOCH
+
+        return cls._cached(y, m, d, ordinal_date, holocene)
+
+    @classmethod
+    def fromordinal_array(cls, ordinal_dates, holocene=False):
+        """Convert a whole array of ordinals at once, using NumPy.
+
+        Returns a structured array with the fields
+        year, month, day, day_in_year and week_in_year.
+        """
+        if np is None:
+            raise ImportError('fromordinal_array requires NumPy')
+
+        return _ordinal_to_year_month_day_array(ordinal_dates, holocene)
+
+    @classmethod
+    def to_ordinal_array(cls, years, months, days, holocene=False):
+        "Convert whole arrays of years, months and days to ordinals at once, using NumPy."
+        if np is None:
+            raise ImportError('to_ordinal_array requires NumPy')
+
+        return _year_month_day_to_ordinal_array(years, months, days, holocene)
 
     @classmethod
     def fromisoformat(cls, date_string):
@@ -302,51 +484,33 @@ class SymmetricDate():
 
     @property
     def gregorian_date(self):
-        if self._gregorian_date:
-            return self._gregorian_date
+        if self._gregorian_date is None:
+            ordinal_date = self._ordinal_date
+
+            #
+            # Holocene ordinals count from 00_001-01-01 HOLOCENE
+            #
+            if self._holocene:
+                ordinal_date += HOLOCENE_EPOCH - EPOCH
 
-        raise ValueError('Holocene date outside Python''s date range')
+            if ordinal_date < 1:
+                raise ValueError('Holocene date outside Python''s date range')
+
+            self._gregorian_date = _datetime.date.fromordinal(ordinal_date)
+
+        return self._gregorian_date
 
     def ctime(self):
         return self.gregorian_date.ctime()
 
     def _strftime_locale(self, format='%a'):
         if format == '%a' or format == '%A':
-            weekday_names = {
-                0: (locale.ABDAY_2, locale.DAY_2),
-                1: (locale.ABDAY_3, locale.DAY_3),
-                2: (locale.ABDAY_4, locale.DAY_4),
-                3: (locale.ABDAY_5, locale.DAY_5),
-                4: (locale.ABDAY_6, locale.DAY_6),
-                5: (locale.ABDAY_7, locale.DAY_7),
-                6: (locale.ABDAY_1, locale.DAY_1),
-            }
-
-            if format == '%a':
-                return locale.nl_langinfo(weekday_names[self.weekday()][0])
-            else:
-                return locale.nl_langinfo(weekday_names[self.weekday()][1])
+            weekday = self.weekday()
+            return locale.nl_langinfo(_ABDAY[weekday] if format == '%a' else _DAY[weekday])
 
         elif format == '%b' or format == '%B':
-            month_names = {
-                1: (locale.ABMON_1, locale.MON_1),
-                2: (locale.ABMON_2, locale.MON_2),
-                3: (locale.ABMON_3, locale.MON_3),
-                4: (locale.ABMON_4, locale.MON_4),
-                5: (locale.ABMON_5, locale.MON_5),
-                6: (locale.ABMON_6, locale.MON_6),
-                7: (locale.ABMON_7, locale.MON_7),
-                8: (locale.ABMON_8, locale.MON_8),
-                9: (locale.ABMON_9, locale.MON_9),
-                10: (locale.ABMON_10, locale.MON_10),
-                11: (locale.ABMON_11, locale.MON_11),
-                12: (locale.ABMON_12, locale.MON_12),
-            }
-
-            if format == '%b':
-                return locale.nl_langinfo(month_names[self._month][0])
-            else:
-                return locale.nl_langinfo(month_names[self._month][1])
+            month = self._month - 1
+            return locale.nl_langinfo(_ABMON[month] if format == '%b' else _MON[month])
 
         elif format == '%E' or format == '%EC':
             used_locale = locale.getlocale()[0]
@@ -377,15 +541,17 @@ class SymmetricDate():
                     return 'BC' if format == '%EC' else 'BCE'
 
     def _strftime_day_in_year(self):
-        y, m, d, diy, wiy = _ordinal_to_year_month_day(self.toordinal())
-        return str(diy)
+        return str(DAYS_BEFORE_MONTH[self._month] + self._day)
 
     def _strftime_week_in_year(self):
-        y, m, d, diy, wiy = _ordinal_to_year_month_day(self.toordinal())
-        return str(wiy)
+        day_in_year = DAYS_BEFORE_MONTH[self._month] + self._day
+        return str((day_in_year + 6) // 7)
 
     def _strftime_weekday_number(self):
-        return str(self.weekday() + 1)
+        #
+        # Sunday == 0 ... Saturday == 6
+        #
+        return str(self._ordinal_date % 7)
 
     def _strftime_ordinal_suffix(self):
         used_locale = locale.getlocale()[0]
@@ -408,108 +574,29 @@ class SymmetricDate():
         else:
             return 'th'
 
-    def strftime(self, fmt):
+    def _strftime_symmetric(self, fmt):
         #
-        # Deals with what is or may be different from the Gregorian Calendar
+        # Deals with what is or may be different from the Gregorian Calendar;
+        # the templates depend on the locale, so they are expanded
+        # and the expanded format is compiled (and cached) in turn
         #
-        fmt = fmt.replace('%%', '__PERCENT__')
-
-        if '%a' in fmt:
-            fmt = fmt.replace('%a', self._strftime_locale('%a'))
-
-        if '%A' in fmt:
-            fmt = fmt.replace('%A', self._strftime_locale('%A'))
-
-        if '%d' in fmt:
-            fmt = fmt.replace('%d', str(self.day).zfill(2))
-
-        if '%-d' in fmt:
-            fmt = fmt.replace('%-d', str(self.day))
+        has_templates, directives, tail = _compile_strftime(fmt)
 
-        if '%e' in fmt:
-            fmt = fmt.replace('%e', str(self.day).rjust(2))
+        if has_templates:
+            fmt = _STRFTIME_TEMPLATES_RE.sub(lambda match: _STRFTIME_TEMPLATES[match[0]](), fmt)
+            has_templates, directives, tail = _compile_strftime(fmt)
 
-        if '%-e' in fmt:
-            fmt = fmt.replace('%-e', str(self.day))
-
-        if '%o' in fmt:
-            fmt = fmt.replace('%o', self._strftime_ordinal_suffix())
-
-        if '%m' in fmt:
-            fmt = fmt.replace('%m', str(self.month).zfill(2))
-
-        if '%-m' in fmt:
-            fmt = fmt.replace('%-m', str(self.month))
-
-        if '%b' in fmt:
-            fmt = fmt.replace('%b', self._strftime_locale('%b'))
-
-        if '%h' in fmt:
-            fmt = fmt.replace('%h', self._strftime_locale('%b'))
-
-        if '%B' in fmt:
-            fmt = fmt.replace('%B', self._strftime_locale('%B'))
-
-        if '%y' in fmt:
-            fmt = fmt.replace('%y', str(self.year)[-2:])
-
-        if '%Y' in fmt:
-            fmt = fmt.replace('%Y', str(self.year))
-
-        if '%EC' in fmt:
-            fmt = fmt.replace('%EC', self._strftime_locale('%EC'))
-
-        if '%E' in fmt:
-            fmt = fmt.replace('%E', self._strftime_locale('%E'))
-
-        if '%j' in fmt:
-            fmt = fmt.replace('%j', self._strftime_day_in_year().zfill(3))
-
-        if '%-j' in fmt:
-            fmt = fmt.replace('%j', self._strftime_day_in_year())
-
-        if '%w' in fmt:
-            fmt = fmt.replace('%w', self._strftime_weekday_number())
-
-        if '%U' in fmt:
-            fmt = fmt.replace('%U', self._strftime_week_in_year().zfill(2))
-
-        if '%-U' in fmt:
-            fmt = fmt.replace('%U', self._strftime_week_in_year())
-
-        if '%W' in fmt:
-            fmt = fmt.replace('%W', self._strftime_week_in_year().zfill(2))
-
-        if '%-W' in fmt:
-            fmt = fmt.replace('%W', self._strftime_week_in_year())
-
-        if '%c' in fmt:
-            fmt = fmt.replace('%c', self.strftime(locale.nl_langinfo(locale.D_T_FMT)))
-            fmt = self.strftime(fmt)
-
-        if '%x' in fmt:
-            fmt = fmt.replace('%x', self.strftime(locale.nl_langinfo(locale.D_FMT)))
-            fmt = self.strftime(fmt)
-
-        if '%X' in fmt:
-            fmt = fmt.replace('%X', self.strftime(locale.nl_langinfo(locale.T_FMT)))
-            fmt = self.strftime(fmt)
-
-        if '%D' in fmt:
-            fmt = fmt.replace('%D', '%m/%d/%y')
-            fmt = self.strftime(fmt)
-
-        if '%F' in fmt:
-            fmt = fmt.replace('%F', '%Y-%m-%d')
-            fmt = self.strftime(fmt)
-
-        if '%n' in fmt:
-            fmt = fmt.replace('%n', '\n')
+        #
+        # Nothing for the Symmetry454 calendar, the format goes
+        # to the Gregorian strftime as it is
+        #
+        if not directives:
+            return tail
 
-        if '%t' in fmt:
-            fmt = fmt.replace('%t', '\n')
+        return ''.join([literal + directive(self) for literal, directive in directives]) + tail
 
-        fmt = fmt.replace('__PERCENT__', '%%')
+    def strftime(self, fmt):
+        fmt = self._strftime_symmetric(fmt)
 
         if '%' not in fmt:
             return fmt
@@ -524,7 +611,7 @@ class SymmetricDate():
         return str(self)
 
     def isoformat(self):
-        return f'{str(self.year).zfill(4)}-{str(self.month).zfill(2)}-{str(self.day).zfill(2)}'
+        return f'{str(self._year).zfill(4)}-{str(self._month).zfill(2)}-{str(self._day).zfill(2)}'
 
     __str__ = isoformat
 
@@ -549,6 +636,9 @@ class SymmetricDate():
 
     @property
     def is_leap(self):
+        if self._is_leap is None:
+            self._is_leap = _is_leap(self._year, self._holocene)
+
         return bool(self._is_leap)
 
     @property
@@ -587,82 +677,129 @@ class SymmetricDate():
         return type(self)(year, month, day, holocene=self._holocene)
 
     # Comparisons of date objects with other.
+    #
+    # Another SymmetricDate with the same year counting is compared by its stored ordinal;
+    # otherwise, Holocene ordinals are converted first, see _cmp
+    #
 
     def __eq__(self, other):
-        if type(other) in (_datetime.date, SymmetricDate):
+        if other.__class__ is SymmetricDate and other._holocene == self._holocene:
+            return self._ordinal_date == other._ordinal_date
+        if other.__class__ is SymmetricDate or other.__class__ is _datetime.date:
             return self._cmp(other) == 0
         return NotImplemented
 
     def __le__(self, other):
-        if type(other) in (_datetime.date, SymmetricDate):
+        if other.__class__ is SymmetricDate and other._holocene == self._holocene:
+            return self._ordinal_date <= other._ordinal_date
+        if other.__class__ is SymmetricDate or other.__class__ is _datetime.date:
             return self._cmp(other) <= 0
         return NotImplemented
 
     def __lt__(self, other):
-        if type(other) in (_datetime.date, SymmetricDate):
+        if other.__class__ is SymmetricDate and other._holocene == self._holocene:
+            return self._ordinal_date < other._ordinal_date
+        if other.__class__ is SymmetricDate or other.__class__ is _datetime.date:
             return self._cmp(other) < 0
         return NotImplemented
 
     def __ge__(self, other):
-        if type(other) in (_datetime.date, SymmetricDate):
+        if other.__class__ is SymmetricDate and other._holocene == self._holocene:
+            return self._ordinal_date >= other._ordinal_date
+        if other.__class__ is SymmetricDate or other.__class__ is _datetime.date:
             return self._cmp(other) >= 0
         return NotImplemented
 
     def __gt__(self, other):
-        if type(other) in (_datetime.date, SymmetricDate):
+        if other.__class__ is SymmetricDate and other._holocene == self._holocene:
+            return self._ordinal_date > other._ordinal_date
+        if other.__class__ is SymmetricDate or other.__class__ is _datetime.date:
             return self._cmp(other) > 0
         return NotImplemented
 
     def _cmp(self, other):
-        assert type(other) in (_datetime.date, SymmetricDate)
+        assert isinstance(other, _DATE_TYPES)
 
-        this_ordinal = self.toordinal()
-        other_ordinal = other.toordinal()
+        #
+        # Holocene ordinals count from 00_001-01-01 HOLOCENE,
+        # so both are counted from 0_001-01-01, as in __sub__
+        #
+        this_ordinal = self._ordinal_date
+
+        if self._holocene:
+            this_ordinal += HOLOCENE_EPOCH - EPOCH
+
+        if isinstance(other, SymmetricDate):
+            other_ordinal = other._ordinal_date
+
+            if other._holocene:
+                other_ordinal += HOLOCENE_EPOCH - EPOCH
 
-        if this_ordinal == other_ordinal:
-            return 0
-        elif this_ordinal > other_ordinal:
-            return 1
         else:
-            return -1
+            other_ordinal = other.toordinal()
+
+        return (this_ordinal > other_ordinal) - (this_ordinal < other_ordinal)
 
     def __hash__(self):
-        "Hash."
+        "Hash, the same as the Gregorian date’s, since both compare equal."
         if self._hashcode == -1:
-            self._hashcode = hash(self._getstate())
+            try:
+                self._hashcode = hash(self.gregorian_date)
+            except ValueError:
+                self._hashcode = hash(self._ordinal_date)
         return self._hashcode
 
     # Computations
 
     def __add__(self, other):
         "Add a date to a timedelta."
-        if isinstance(other, timedelta):
-            o = self.toordinal() + other.days
-            if 0 < o <= MAXORDINAL:
-                return type(self).fromordinal(o)
-            raise OverflowError("result out of range")
+        if isinstance(other, _datetime.timedelta):
+            return self._add_days(other.days)
         return NotImplemented
 
     __radd__ = __add__
 
     def __sub__(self, other):
         """Subtract two dates, or a date and a timedelta."""
-        if isinstance(other, timedelta):
-            return self + timedelta(-other.days)
-        if isinstance(other, _datetime.date) or isinstance(other, SymmetricDate):
-            days1 = self.toordinal()
-            days2 = other.toordinal()
-            return timedelta(days1 - days2)
+        if isinstance(other, _datetime.timedelta):
+            return self._add_days(-other.days)
+        if isinstance(other, _DATE_TYPES):
+            days1 = self._ordinal_date
+            if self._holocene:
+                days1 += HOLOCENE_EPOCH - EPOCH
+            if isinstance(other, SymmetricDate):
+                days2 = other._ordinal_date
+                if other._holocene:
+                    days2 += HOLOCENE_EPOCH - EPOCH
+            else:
+                days2 = other.toordinal()
+            return _datetime.timedelta(days1 - days2)
         return NotImplemented
 
+    def _add_days(self, days):
+        "days -> new date that many days later, counted the same way (Holocene or not)."
+        #
+        # Holocene ordinals count from 00_001-01-01 HOLOCENE,
+        # fromordinal takes them counted from 0_001-01-01
+        #
+        if self._holocene:
+            o = self._ordinal_date + days + HOLOCENE_EPOCH - EPOCH
+            min_ordinal = HOLOCENE_EPOCH
+        else:
+            o = self._ordinal_date + days
+            min_ordinal = EPOCH
+
+        if min_ordinal <= o <= MAXORDINAL:
+            return type(self).fromordinal(o, holocene=self._holocene)
+        raise OverflowError("result out of range")
+
     def weekday(self):
-        return self.ordinal_date % 7
+        "Monday == 0 ... Sunday == 6; ordinal 1 (and every year) starts on a Monday."
+        return (self._ordinal_date - 1) % 7
 
     def isoweekday(self):
-        if self.ordinal_date % 7 == 0:
-            return 7
-
-        return self.weekday()
+        "Monday == 1 ... Sunday == 7."
+        return ((self._ordinal_date - 1) % 7) + 1
 
     def isocalendar(self):
         return self.gregorian_date.isocalendar()
@@ -670,11 +807,7 @@ class SymmetricDate():
     # Pickle support.
 
     def _getstate(self):
-        return self.gregorian_date._getstate()
-
-    def __setstate(self, string):
-        yhi, ylo, self._month, self._day = string
-        self._year = yhi * 256 + ylo
+        return self._year, self._month, self._day, self._holocene
 
     def __reduce__(self):
         return (self.__class__, self._getstate())
@@ -686,6 +819,11 @@ SymmetricDate.resolution = _datetime.timedelta(days=1)
 
 SymmetricDate.holocene_max = SymmetricDate(19_998, 12, 28, holocene=True)
 
+#
+# Built once, for the isinstance checks above
+#
+_DATE_TYPES = (_datetime.date, SymmetricDate)
+
 
 if __name__ == '__main__':
     try:
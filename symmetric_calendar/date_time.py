@@ -16,52 +16,113 @@ __all__ = ('SymmetricDateTime')
 import datetime as _datetime
 import time as _time
 
-from .date import SymmetricDate, POSIX_EPOCH
+from functools import partial
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+from .date import SymmetricDate, POSIX_EPOCH, EPOCH, HOLOCENE_EPOCH, MINYEAR, MAXYEAR, MAXORDINAL, _DATE_TYPES, _check_date_fields, \
+    _year_month_day_to_ordinal_array, _ordinal_to_year_month_day_array
+from ._kernels import _year_month_day_to_ordinal, _ordinal_to_year_month_day
+
+
+def _since_epoch(date_time):
+    "datetime or SymmetricDateTime -> wall clock time since 0_001-01-01 00:00, as a timedelta."
+    ordinal_date = date_time.toordinal()
+
+    #
+    # Holocene ordinals count from 00_001-01-01 HOLOCENE
+    #
+    if isinstance(date_time, SymmetricDateTime) and date_time._holocene:
+        ordinal_date += HOLOCENE_EPOCH - EPOCH
+
+    seconds = (date_time.hour * 3_600) + (date_time.minute * 60) + date_time.second
+    return _datetime.timedelta(ordinal_date, seconds, date_time.microsecond)
 
 
 class SymmetricDateTime(SymmetricDate):
-    __slots__ =  '_date', '_time', '_year', '_month', '_day', '_hashcode', '_gregorian_date', '_holocene', '_is_leap', '_hour', '_minute', '_second', '_microsecond', '_tzinfo', '_hashcode', '_fold', '_gregorian_date_time'
+    #
+    # The date slots (_year, _month, _day, _ordinal_date, ...) come from SymmetricDate;
+    # declaring them again would only add unused copies to every instance
+    #
+    __slots__ = '_date', '_time', '_hour', '_minute', '_second', '_microsecond', '_tzinfo', '_fold', '_gregorian_date_time', '_timestamp', '_isoformat'
 
     def __new__(cls, year, month=None, day=None, hour=0, minute=0, second=0, microsecond=0, tzinfo=None, *, holocene=False, fold=0):
         if month is None:
-            if type(year) in (_datetime.datetime, SymmetricDateTime):
-                return cls.fromtimestamp(year.timestamp())
-
-            elif type(year) == str:
-                year, month, day = year.split('-')
-                day, time = day.split(' ')
+            if isinstance(year, SymmetricDateTime):
+                return cls._fromgregorian(year.gregorian_date_time, holocene)
+
+            elif isinstance(year, _datetime.datetime):
+                return cls._fromgregorian(year, holocene)
+
+            elif isinstance(year, _DATE_TYPES):
+                #
+                # Midnight (or the time given) of that date,
+                # which already knows its ordinal and year counting
+                #
+                if not isinstance(year, SymmetricDate):
+                    year = SymmetricDate(year, holocene=holocene)
+
+                time = _datetime.time(hour, minute, second, microsecond, tzinfo, fold=fold)
+                return cls._fromfields(year._year, year._month, year._day, year._ordinal_date, year._holocene, time)
+
+            elif isinstance(year, str):
+                date, time = year.split(' ')
+                year, month, day = date.split('-')
                 year = int(year)
                 month = int(month)
                 day = int(day)
 
-                if '.' in time:
-                    time, microsecond = time.split('.')
-                    microsecond = int(microsecond)
+                #
+                # The time of day is the same in both calendars,
+                # so Python’s own parser deals with it, fractions of a second included
+                #
+                time = _datetime.time.fromisoformat(time)
+                hour = time.hour
+                minute = time.minute
+                second = time.second
+                microsecond = time.microsecond
+
+                if time.tzinfo is not None:
+                    tzinfo = time.tzinfo
 
-                hour, minute, second = time.split(':')
-                hour = int(hour)
-                minute = int(minute)
-                second = int(second)
+        _check_date_fields(year, month, day, holocene)
 
+        time = _datetime.time(hour, minute, second, microsecond, tzinfo, fold=fold)
+        ordinal_date = _year_month_day_to_ordinal(year, month, day, holocene)
+        return cls._fromfields(year, month, day, ordinal_date, holocene, time)
+
+    @classmethod
+    def _fromfields(cls, year, month, day, ordinal_date, holocene, time=_datetime.time()):
+        "Already checked year, month, day, their ordinal and a time -> new datetime."
+        #
+        # The date fields are kept here; the SymmetricDate itself
+        # is only built when asked for, see date
+        #
         self = object.__new__(cls)
-        self._date = SymmetricDate(year, month, day, holocene=holocene)
-        self._year = self._date.year
-        self._month = self._date.month
-        self._day = self._date.day
-        self._holocene = self._date.is_holocene
-        self._is_leap = self._date.is_leap
-        self._gregorian_date = self._date.gregorian_date
+        self._date = None
+        self._year = year
+        self._month = month
+        self._day = day
+        self._ordinal_date = ordinal_date
+        self._holocene = holocene
+        self._is_leap = None
+        self._gregorian_date = None
         self._hashcode = -1
 
-        self._time = _datetime.time(hour, minute, second, microsecond, tzinfo, fold=fold)
-        self._hour = self._time.hour
-        self._minute = self._time.minute
-        self._second = self._time.second
-        self._microsecond = self._time.microsecond
-        self._tzinfo = self._time.tzinfo
-        self._fold = self._time.fold
-
-        self._gregorian_date_time = _datetime.datetime.combine(self._gregorian_date, self._time)
+        self._time = time
+        self._hour = time.hour
+        self._minute = time.minute
+        self._second = time.second
+        self._microsecond = time.microsecond
+        self._tzinfo = time.tzinfo
+        self._fold = time.fold
+        self._gregorian_date_time = None
+        self._timestamp = None
+        self._isoformat = None
         return self
 
     @property
@@ -88,60 +149,187 @@ class SymmetricDateTime(SymmetricDate):
     def fold(self):
         return self._fold
 
+    @property
+    def gregorian_date_time(self):
+        if self._gregorian_date_time is None:
+            self._gregorian_date_time = _datetime.datetime.combine(self.gregorian_date, self._time)
+
+        return self._gregorian_date_time
+
     @property
     def date(self):
+        if self._date is None:
+            self._date = SymmetricDate(self._year, self._month, self._day, holocene=self._holocene)
+
         return self._date
 
     @property
     def time(self):
         return self._time
 
+    def utcoffset(self):
+        "Return the time zone offset as a timedelta, positive east of UTC (None when naive)."
+        if self._tzinfo is None:
+            return None
+
+        #
+        # A fixed offset doesn’t need the Gregorian datetime
+        #
+        if self._tzinfo.__class__ is _datetime.timezone:
+            return self._tzinfo.utcoffset(None)
+
+        return self.gregorian_date_time.utcoffset()
+
     def isoformat(self, sep='T', timespec='auto'):
-        return self._date.isoformat() + sep + self._time.isoformat(timespec)
+        if timespec != 'auto':
+            return super().isoformat() + sep + self._time.isoformat(timespec)
 
-    def __repr__(self):
-        """Convert to formal string, for repr()."""
-        L = [self._year, self._month, self._day,  # These are never zero
-             self._hour, self._minute, self._second, self._microsecond]
+        #
+        # The date and time parts with the default timespec are kept,
+        # they are what str() and most callers use
+        #
+        if self._isoformat is None:
+            self._isoformat = super().isoformat(), self._time.isoformat()
 
-        if L[-1] == 0:
-            del L[-1]
+        date, time = self._isoformat
+        return date + sep + time
 
-        if L[-1] == 0:
-            del L[-1]
+    def __repr__(self):
+        """Convert to formal string, for repr()."""
+        #
+        # As datetime, trailing zero microsecond and second are left out
+        #
+        s = f'{self.__class__.__qualname__}({self._year}, {self._month}, {self._day}, {self._hour}, {self._minute}'
 
-        s = f'{self.__class__.__qualname__}{tuple(L)}'
+        if self._microsecond:
+            s += f', {self._second}, {self._microsecond}'
+        elif self._second:
+            s += f', {self._second}'
 
         if self._tzinfo is not None:
-            assert s[-1:] == ")"
-            s = s[:-1] + ", tzinfo=%r" % self._tzinfo + ")"
+            s += f', tzinfo={self._tzinfo!r}'
 
         if self._fold:
-            assert s[-1:] == ")"
-            s = s[:-1] + ", fold=1)"
+            s += ', fold=1'
 
-        return s
+        return s + ')'
 
     def __str__(self):
         "Convert to string, for str()."
         return self.isoformat(sep=' ')
 
     def timestamp(self):
-        dt = _datetime.datetime.combine(self._date.gregorian_date, self._time, self._tzinfo)
-        return dt.timestamp()
+        if self._timestamp is None:
+            #
+            # With a fixed offset (UTC included), the seconds since the POSIX epoch
+            # come straight from the ordinal and the time fields, counted in
+            # microseconds so that the result is the same as datetime’s;
+            # local time and other time zones need Python’s rules
+            #
+            if self._tzinfo.__class__ is _datetime.timezone:
+                ordinal_date = self._ordinal_date
+
+                if self._holocene:
+                    ordinal_date += HOLOCENE_EPOCH - EPOCH
+
+                offset = self._tzinfo.utcoffset(None)
+                seconds = ((ordinal_date - POSIX_EPOCH) * 86_400) + (self._hour * 3_600) + (self._minute * 60) + self._second
+                seconds -= (offset.days * 86_400) + offset.seconds
+                self._timestamp = ((seconds * 1_000_000) + self._microsecond - offset.microseconds) / 1_000_000
+
+            else:
+                self._timestamp = self.gregorian_date_time.timestamp()
+
+        return self._timestamp
 
     @classmethod
     def fromtimestamp(cls, timestamp, tzinfo=None):
-        dt = _datetime.datetime.fromtimestamp(timestamp, tzinfo)
-        date = SymmetricDate(dt.date())
-        return cls(date.year, date.month, date.day, dt.hour, dt.minute, dt.second, dt.microsecond, dt.tzinfo, fold=dt.fold)
+        return cls._fromgregorian(_datetime.datetime.fromtimestamp(timestamp, tzinfo))
+
+    @classmethod
+    def _fromgregorian(cls, gregorian_date_time, holocene=False):
+        "Gregorian datetime -> the same date and time, converted only once."
+        ordinal_date = gregorian_date_time.toordinal()
+        year, month, day, day_in_year, week_in_year = _ordinal_to_year_month_day(ordinal_date, holocene)
+        _check_date_fields(year, month, day, holocene)
+
+        if holocene:
+            ordinal_date += EPOCH - HOLOCENE_EPOCH
+
+        self = cls._fromfields(year, month, day, ordinal_date, holocene, gregorian_date_time.timetz())
+        self._gregorian_date = gregorian_date_time.date()
+        return self
+
+    @classmethod
+    def from_arrays(cls, years, months, days, hours=0, minutes=0, seconds=0, microseconds=0, tzinfo=None, *, holocene=False):
+        """Build a whole NumPy object array of datetimes at once.
+
+        The date fields are checked and converted to ordinals as arrays,
+        and the arrays are broadcast against each other.
+        """
+        if np is None:
+            raise ImportError('from_arrays requires NumPy')
+
+        #
+        # The objects are built from the same integer arrays that were checked
+        #
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+
+        ordinal_dates = _year_month_day_to_ordinal_array(years, months, days, holocene)
+        fields = np.broadcast_arrays(ordinal_dates, years, months, days, hours, minutes, seconds, microseconds)
+
+        result = np.empty(fields[0].shape, dtype=object)
+        flat_result = result.reshape(-1)
+
+        for i, (ordinal_date, year, month, day, hour, minute, second, microsecond) in enumerate(zip(*[field.ravel().tolist() for field in fields])):
+            time = _datetime.time(hour, minute, second, microsecond, tzinfo)
+            flat_result[i] = cls._fromfields(year, month, day, ordinal_date, holocene, time)
+
+        return result
+
+    @classmethod
+    def fromtimestamps(cls, timestamps, tzinfo=None):
+        """Build a whole NumPy object array of datetimes from POSIX timestamps at once.
+
+        The ordinals are converted to year, month and day as arrays.
+        """
+        if np is None:
+            raise ImportError('fromtimestamps requires NumPy')
+
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+
+        gregorian_date_times = [_datetime.datetime.fromtimestamp(timestamp, tzinfo) for timestamp in timestamps.ravel().tolist()]
+        ordinal_dates = np.fromiter((dt.toordinal() for dt in gregorian_date_times), dtype=np.int64, count=len(gregorian_date_times))
+        fields = _ordinal_to_year_month_day_array(ordinal_dates)
+
+        #
+        # Gregorian dates late in 9_999 are already past MAXYEAR,
+        # as in fromtimestamp
+        #
+        if np.any((fields['year'] < MINYEAR) | (fields['year'] > MAXYEAR)):
+            raise ValueError('Year must be in %d..%d' % (MINYEAR, MAXYEAR))
+
+        result = np.empty(timestamps.shape, dtype=object)
+        flat_result = result.reshape(-1)
+
+        for i, (dt, ordinal_date, year, month, day) in enumerate(zip(gregorian_date_times, ordinal_dates.tolist(), fields['year'].tolist(), fields['month'].tolist(), fields['day'].tolist())):
+            flat_result[i] = cls._fromfields(year, month, day, ordinal_date, False, dt.timetz())
+
+        return result
 
     def strftime(self, fmt):
         #
-        # Deals with what is or may be different from the Gregorian Calendar
+        # Only the date directives are dealt with here, leaving
+        # the time ones, and any %%, to the Gregorian datetime
         #
-        fmt = self._date.strftime(fmt)
-        return self._gregorian_date_time.strftime(fmt)
+        fmt = self._strftime_symmetric(fmt)
+
+        if '%' not in fmt:
+            return fmt
+
+        return self.gregorian_date_time.strftime(fmt)
 
     @classmethod
     def now(cls, tzinfo=None):
@@ -149,49 +337,170 @@ class SymmetricDateTime(SymmetricDate):
 
     @classmethod
     def combine(cls, date: SymmetricDate | _datetime.date | str, time: _datetime.time, tzinfo=True):
-        if type(date) != SymmetricDate:
+        if not isinstance(date, SymmetricDate):
             date = SymmetricDate(date)
 
         if tzinfo is True:
             tzinfo = time.tzinfo
 
-        return cls(date.year, date.month, date.day, time.hour, time.minute, time.second, time.microsecond, tzinfo, fold=time.fold)
+        if tzinfo is not time.tzinfo:
+            time = time.replace(tzinfo=tzinfo)
+
+        #
+        # The date is already checked, and knows its ordinal
+        #
+        return cls._fromfields(date._year, date._month, date._day, date._ordinal_date, date._holocene, time)
 
     def __eq__(self, other):
-        if type(other) in (_datetime.datetime, SymmetricDateTime):
-            return self._cmp(other) == 0
+        if isinstance(other, _DATE_TIME_TYPES):
+            return self._cmp(other, allow_mixed=True) == 0
         return NotImplemented
 
     def __le__(self, other):
-        if type(other) in (_datetime.datetime, SymmetricDateTime):
+        if isinstance(other, _DATE_TIME_TYPES):
             return self._cmp(other) <= 0
         return NotImplemented
 
     def __lt__(self, other):
-        if type(other) in (_datetime.datetime, SymmetricDateTime):
+        if isinstance(other, _DATE_TIME_TYPES):
             return self._cmp(other) < 0
         return NotImplemented
 
     def __ge__(self, other):
-        if type(other) in (_datetime.datetime, SymmetricDateTime):
+        if isinstance(other, _DATE_TIME_TYPES):
             return self._cmp(other) >= 0
         return NotImplemented
 
     def __gt__(self, other):
-        if type(other) in (_datetime.datetime, SymmetricDateTime):
+        if isinstance(other, _DATE_TIME_TYPES):
             return self._cmp(other) > 0
         return NotImplemented
 
-    def _cmp(self, other):
-        assert type(other) in (_datetime.datetime, SymmetricDateTime)
+    def _cmp(self, other, allow_mixed=False):
+        assert isinstance(other, _DATE_TIME_TYPES)
+
+        #
+        # With the same time zone (or none at all) and the same year counting,
+        # the fields compare just as the moments they stand for
+        #
+        if isinstance(other, SymmetricDateTime) and other._tzinfo is self._tzinfo and other._holocene == self._holocene:
+            this = self._ordinal_date, self._hour, self._minute, self._second, self._microsecond
+            that = other._ordinal_date, other._hour, other._minute, other._second, other._microsecond
+            return (this > that) - (this < that)
+
+        this_offset = self.utcoffset()
+        other_offset = other.utcoffset()
+
+        #
+        # As datetime, naive and aware values are never equal,
+        # and can’t be ordered
+        #
+        if (this_offset is None) != (other_offset is None):
+            if allow_mixed:
+                return 2  # arbitrary non-zero value
+            raise TypeError('cannot compare naive and aware datetimes')
+
+        this = _since_epoch(self)
+        that = _since_epoch(other)
+
+        #
+        # With the same UTC offset (or none at all), the wall clock times are enough
+        #
+        if this_offset != other_offset:
+            this -= this_offset
+            that -= other_offset
+
+        return (this > that) - (this < that)
+
+    def __hash__(self):
+        "Hash, the same as the Gregorian datetime’s, since both compare equal."
+        #
+        # Defining __eq__ above left SymmetricDateTime unhashable
+        #
+        if self._hashcode == -1:
+            try:
+                self._hashcode = hash(self.gregorian_date_time)
+            except ValueError:
+                #
+                # Outside Python’s date range, the moment itself,
+                # in UTC when aware, so that equal values hash the same
+                #
+                delta = _since_epoch(self)
+                offset = self.utcoffset()
 
-        this_timestamp = self.timestamp()
-        other_timestamp = other.timestamp()
+                if offset is not None:
+                    delta -= offset
 
-        if this_timestamp == other_timestamp:
-            return 0
-        elif this_timestamp > other_timestamp:
-            return 1
-        else:
-            return -1
+                self._hashcode = hash(delta)
+        return self._hashcode
 
+    # Computations
+
+    def __add__(self, other):
+        "Add a datetime to a timedelta."
+        if not isinstance(other, _datetime.timedelta):
+            return NotImplemented
+
+        delta = _since_epoch(self) + other
+        ordinal_date = delta.days
+        holocene = self._holocene
+
+        if not (HOLOCENE_EPOCH if holocene else EPOCH) <= ordinal_date <= MAXORDINAL:
+            raise OverflowError("result out of range")
+
+        year, month, day, day_in_year, week_in_year = _ordinal_to_year_month_day(ordinal_date, holocene)
+
+        if holocene:
+            ordinal_date += EPOCH - HOLOCENE_EPOCH
+
+        hour, rem = divmod(delta.seconds, 3_600)
+        minute, second = divmod(rem, 60)
+        time = _datetime.time(hour, minute, second, delta.microseconds, self._tzinfo)
+        return type(self)._fromfields(year, month, day, ordinal_date, holocene, time)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        "Subtract two datetimes, or a datetime and a timedelta."
+        if isinstance(other, _datetime.timedelta):
+            return self + -other
+
+        if not isinstance(other, _DATE_TIME_TYPES):
+            return NotImplemented
+
+        this = _since_epoch(self)
+        that = _since_epoch(other)
+
+        #
+        # As datetime, the offsets only count between different time zones
+        #
+        if self._tzinfo is other.tzinfo:
+            return this - that
+
+        this_offset = self.utcoffset()
+        other_offset = other.utcoffset()
+
+        if this_offset == other_offset:
+            return this - that
+
+        if this_offset is None or other_offset is None:
+            raise TypeError('cannot mix naive and timezone-aware time')
+
+        return (this - this_offset) - (that - other_offset)
+
+    # Pickle support.
+
+    def _getstate(self):
+        return self._year, self._month, self._day, self._hour, self._minute, self._second, self._microsecond, self._tzinfo
+
+    def __reduce__(self):
+        #
+        # holocene and fold are keyword only arguments
+        #
+        return (partial(self.__class__, holocene=self._holocene, fold=self._fold), self._getstate())
+
+
+#
+# Built once, for the isinstance checks above
+#
+_DATE_TIME_TYPES = (_datetime.datetime, SymmetricDateTime)
@@ -0,0 +1,202 @@
+import datetime
+import pickle
+import unittest
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+from symmetric_calendar import SymmetricDate
+
+
+class TestSymmetricDateConstructor(unittest.TestCase):
+    def test_from_symmetric_date(self):
+        date = SymmetricDate(SymmetricDate(2_023, 1, 15))
+
+        self.assertEqual((date.year, date.month, date.day), (2_023, 1, 15))
+        self.assertFalse(date.is_holocene)
+
+    def test_from_holocene_symmetric_date(self):
+        for holocene in (False, True):
+            date = SymmetricDate(SymmetricDate(12_023, 1, 1, holocene=True), holocene=holocene)
+
+            self.assertTrue(date.is_holocene)
+            self.assertEqual((date.year, date.month, date.day), (12_023, 1, 1))
+            self.assertEqual(date.ordinal_date, SymmetricDate(12_023, 1, 1, holocene=True).ordinal_date)
+
+    def test_from_gregorian_date(self):
+        self.assertEqual(SymmetricDate(datetime.date(2_023, 1, 2)), SymmetricDate(2_023, 1, 1))
+        self.assertTrue(SymmetricDate(datetime.date(2_023, 1, 2), holocene=True).is_holocene)
+
+
+class TestSymmetricDatePickleAndHash(unittest.TestCase):
+    def test_pickle(self):
+        for date in (SymmetricDate(2_023, 1, 15), SymmetricDate(12_023, 1, 15, holocene=True), SymmetricDate(5_000, 12, 28, holocene=True)):
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                copy = pickle.loads(pickle.dumps(date, protocol))
+
+                self.assertEqual(copy, date)
+                self.assertEqual(copy.is_holocene, date.is_holocene)
+
+    def test_hash(self):
+        date = SymmetricDate(2_023, 1, 15)
+
+        self.assertEqual(hash(date), hash(date.gregorian_date))
+        self.assertEqual(len({date, SymmetricDate(2_023, 1, 15), date.gregorian_date}), 1)
+
+    def test_hash_outside_python_date_range(self):
+        date = SymmetricDate(5_000, 1, 1, holocene=True)
+
+        self.assertEqual(hash(date), hash(SymmetricDate(5_000, 1, 1, holocene=True)))
+
+
+class TestSymmetricDateTimestamp(unittest.TestCase):
+    def test_fromtimestamp(self):
+        for timestamp in (0, 86_399, 86_400, 1_673_784_000, -86_400 * 365):
+            self.assertEqual(SymmetricDate.fromtimestamp(timestamp), datetime.date.fromtimestamp(timestamp))
+
+    def test_fromtimestamp_holocene(self):
+        date = SymmetricDate.fromtimestamp(1_673_784_000, holocene=True)
+
+        self.assertTrue(date.is_holocene)
+        self.assertEqual(date, datetime.date.fromtimestamp(1_673_784_000))
+
+    def test_today(self):
+        self.assertEqual(SymmetricDate.today(), datetime.date.today())
+
+
+class TestSymmetricDateArithmetic(unittest.TestCase):
+    def test_add_and_sub_timedelta(self):
+        date = SymmetricDate(2023, 1, 28)
+
+        self.assertEqual(date + datetime.timedelta(1), SymmetricDate(2023, 2, 1))
+        self.assertEqual(datetime.timedelta(1) + date, SymmetricDate(2023, 2, 1))
+        self.assertEqual(SymmetricDate(2023, 2, 1) - datetime.timedelta(1), date)
+
+    def test_sub_dates(self):
+        self.assertEqual(SymmetricDate(2023, 2, 1) - SymmetricDate(2023, 1, 1), datetime.timedelta(28))
+        self.assertEqual(SymmetricDate(2023, 1, 1) - SymmetricDate(2023, 1, 1).gregorian_date, datetime.timedelta(0))
+
+    def test_holocene_add_and_sub(self):
+        date = SymmetricDate(5_000, 6, 10, holocene=True) + datetime.timedelta(1)
+
+        self.assertTrue(date.is_holocene)
+        self.assertEqual((date.year, date.month, date.day), (5_000, 6, 11))
+
+        date = SymmetricDate(15_000, 6, 10, holocene=True) - datetime.timedelta(1)
+
+        self.assertTrue(date.is_holocene)
+        self.assertEqual((date.year, date.month, date.day), (15_000, 6, 9))
+
+    def test_holocene_sub_dates(self):
+        self.assertEqual(SymmetricDate(12_023, 1, 1, holocene=True) - SymmetricDate(2_023, 1, 1), datetime.timedelta(0))
+        self.assertEqual(SymmetricDate(5_000, 1, 8, holocene=True) - SymmetricDate(5_000, 1, 1, holocene=True), datetime.timedelta(7))
+
+    def test_out_of_range(self):
+        with self.assertRaises(OverflowError):
+            SymmetricDate(1, 1, 1) - datetime.timedelta(1)
+
+        with self.assertRaises(OverflowError):
+            SymmetricDate(1, 1, 1, holocene=True) - datetime.timedelta(1)
+
+        with self.assertRaises(OverflowError):
+            SymmetricDate.holocene_max + datetime.timedelta(1)
+
+
+class TestSymmetricDateComparison(unittest.TestCase):
+    def test_holocene_and_common_era_compare_equal(self):
+        holocene = SymmetricDate(12_023, 1, 1, holocene=True)
+        common_era = SymmetricDate(2_023, 1, 1)
+
+        self.assertEqual(holocene, common_era)
+        self.assertEqual(common_era, holocene)
+        self.assertEqual(hash(holocene), hash(common_era))
+        self.assertEqual(holocene, common_era.gregorian_date)
+        self.assertLessEqual(holocene, common_era)
+        self.assertGreaterEqual(holocene, common_era)
+
+    def test_holocene_and_common_era_order(self):
+        self.assertLess(SymmetricDate(5_000, 1, 1, holocene=True), SymmetricDate(3, 1, 1))
+        self.assertGreater(SymmetricDate(3, 1, 1), SymmetricDate(5_000, 1, 1, holocene=True))
+        self.assertLess(SymmetricDate(12_023, 1, 1, holocene=True), SymmetricDate(2_023, 1, 2))
+        self.assertLess(SymmetricDate(12_023, 1, 1, holocene=True), datetime.date(2_023, 1, 3))
+
+
+class TestSymmetricDateStrftime(unittest.TestCase):
+    def test_unpadded_directives(self):
+        date = SymmetricDate(2_023, 3, 1)
+
+        self.assertEqual(date.strftime('%j %U %W'), '064 10 10')
+        self.assertEqual(date.strftime('%-j %-U %-W'), '64 10 10')
+        self.assertEqual(date.strftime('%-d %-m'), '1 3')
+
+    def test_tab_and_newline(self):
+        self.assertEqual(SymmetricDate(2_023, 3, 1).strftime('%d%t%m%n'), '01\t03\n')
+
+    def test_percent(self):
+        self.assertEqual(SymmetricDate(2_023, 3, 1).strftime('%%d %%%d'), '%d %01')
+
+
+class TestSymmetricDateWeekday(unittest.TestCase):
+    def test_weekday_is_the_gregorian_weekday(self):
+        self.assertEqual(SymmetricDate(1, 1, 1).weekday(), 0)
+        self.assertEqual(SymmetricDate(1, 1, 1).isoweekday(), 1)
+
+        for ordinal_date in range(738_522, 738_522 + 14):
+            date = SymmetricDate.fromordinal(ordinal_date)
+            self.assertEqual(date.weekday(), date.gregorian_date.weekday())
+            self.assertEqual(date.isoweekday(), date.gregorian_date.isoweekday())
+
+    def test_weekday_directives(self):
+        date = SymmetricDate(2_023, 1, 15)
+
+        self.assertEqual(date.strftime('%a %A %w'), 'Mon Monday 1')
+        self.assertEqual(date.strftime('%c'), 'Mon Jan 15 00:00:00 2023')
+        self.assertEqual(SymmetricDate(2_023, 1, 21).strftime('%a %w'), 'Sun 0')
+
+
+@unittest.skipIf(np is None, 'requires NumPy')
+class TestSymmetricDateArrays(unittest.TestCase):
+    def test_fromordinal_array(self):
+        ordinal_dates = np.arange(1, 3_651_691, 997)
+        fields = SymmetricDate.fromordinal_array(ordinal_dates)
+
+        for ordinal_date, year, month, day in zip(ordinal_dates.tolist(), fields['year'].tolist(), fields['month'].tolist(), fields['day'].tolist()):
+            date = SymmetricDate.fromordinal(ordinal_date)
+            self.assertEqual((year, month, day), (date.year, date.month, date.day))
+
+    def test_fromordinal_array_holocene(self):
+        fields = SymmetricDate.fromordinal_array(np.array([1, 738_522]), holocene=True)
+
+        self.assertEqual(fields['year'].tolist(), [10_001, 12_023])
+        self.assertEqual(fields['month'].tolist(), [1, 1])
+        self.assertEqual(fields['day'].tolist(), [1, 1])
+
+    def test_to_ordinal_array(self):
+        ordinal_dates = SymmetricDate.to_ordinal_array([1, 2_004, 9_998], [1, 12, 12], [1, 35, 28])
+
+        self.assertEqual(ordinal_dates.tolist(), [1, SymmetricDate(2_004, 12, 35).ordinal_date, 3_651_690])
+
+    def test_to_ordinal_array_broadcasts(self):
+        ordinal_dates = SymmetricDate.to_ordinal_array(2_023, [1, 2, 3], [[1], [28]])
+
+        self.assertEqual(ordinal_dates.shape, (2, 3))
+        self.assertEqual(ordinal_dates[1, 2], SymmetricDate(2_023, 3, 28).ordinal_date)
+
+    def test_to_ordinal_array_holocene(self):
+        ordinal_dates = SymmetricDate.to_ordinal_array([12_023], [1], [1], holocene=True)
+
+        self.assertEqual(ordinal_dates.tolist(), [SymmetricDate(12_023, 1, 1, holocene=True).ordinal_date])
+
+    def test_to_ordinal_array_out_of_range(self):
+        with self.assertRaises(ValueError):
+            SymmetricDate.to_ordinal_array([2_023], [13], [1])
+
+        with self.assertRaises(ValueError):
+            SymmetricDate.to_ordinal_array([2_023], [12], [29])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import datetime
+import pickle
+import unittest
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+from symmetric_calendar import SymmetricDate, SymmetricDateTime
+
+
+class TestSymmetricDateTimeConstructor(unittest.TestCase):
+    def test_from_symmetric_date(self):
+        date_time = SymmetricDateTime(SymmetricDate(2023, 1, 15))
+
+        self.assertEqual(date_time, SymmetricDateTime(2023, 1, 15, 0, 0))
+        self.assertEqual(date_time.time, datetime.time())
+
+    def test_from_holocene_symmetric_date(self):
+        date_time = SymmetricDateTime(SymmetricDate(12_023, 1, 15, holocene=True))
+
+        self.assertTrue(date_time.is_holocene)
+        self.assertEqual((date_time.year, date_time.month, date_time.day), (12_023, 1, 15))
+        self.assertEqual(date_time.ordinal_date, SymmetricDate(12_023, 1, 15, holocene=True).ordinal_date)
+
+    def test_from_gregorian_date(self):
+        date_time = SymmetricDateTime(datetime.date(2023, 1, 1))
+
+        self.assertEqual(date_time.gregorian_date_time, datetime.datetime(2023, 1, 1))
+        self.assertEqual(date_time.time, datetime.time())
+
+
+class TestSymmetricDateTimeStrftime(unittest.TestCase):
+    def test_time_directives(self):
+        date_time = SymmetricDateTime(2_023, 3, 1, 13, 45, 7, 500, tzinfo=datetime.timezone.utc)
+
+        self.assertEqual(date_time.strftime('%H:%M:%S.%f %Z'), '13:45:07.000500 UTC')
+        self.assertEqual(date_time.strftime('%I %p'), '01 PM')
+
+    def test_date_and_time_directives(self):
+        date_time = SymmetricDateTime(2_023, 3, 1, 13, 45, 7)
+
+        self.assertEqual(date_time.strftime('%Y-%m-%d %H:%M:%S'), '2023-03-01 13:45:07')
+        self.assertEqual(date_time.strftime('%-j %X'), '64 13:45:07')
+
+
+class TestSymmetricDateTimePickle(unittest.TestCase):
+    def test_pickle(self):
+        date_times = (
+            SymmetricDateTime(2_023, 1, 15, 13, 45, 7, 500, tzinfo=datetime.timezone.utc),
+            SymmetricDateTime(12_023, 1, 15, 1, 30, holocene=True, fold=1),
+        )
+
+        for date_time in date_times:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                copy = pickle.loads(pickle.dumps(date_time, protocol))
+
+                self.assertEqual(copy, date_time)
+                self.assertEqual(copy.tzinfo, date_time.tzinfo)
+                self.assertEqual(copy.is_holocene, date_time.is_holocene)
+                self.assertEqual(copy.fold, date_time.fold)
+
+
+class TestSymmetricDateTimeArithmetic(unittest.TestCase):
+    def test_add_and_sub_timedelta(self):
+        date_time = SymmetricDateTime(2023, 1, 15, 10)
+
+        self.assertEqual(date_time + datetime.timedelta(hours=1), SymmetricDateTime(2023, 1, 15, 11))
+        self.assertEqual(datetime.timedelta(hours=14) + date_time, SymmetricDateTime(2023, 1, 16, 0))
+        self.assertEqual(date_time - datetime.timedelta(minutes=1), SymmetricDateTime(2023, 1, 15, 9, 59))
+        self.assertIsInstance(date_time + datetime.timedelta(1), SymmetricDateTime)
+
+    def test_sub_date_times(self):
+        date_time = SymmetricDateTime(2023, 1, 15, 10)
+
+        self.assertEqual(date_time - SymmetricDateTime(2023, 1, 15, 8, 30), datetime.timedelta(hours=1, minutes=30))
+        self.assertEqual(date_time - date_time.gregorian_date_time.replace(hour=8), datetime.timedelta(hours=2))
+
+    def test_sub_aware_date_times(self):
+        utc = SymmetricDateTime(2023, 1, 15, 10, tzinfo=datetime.timezone.utc)
+        brt = SymmetricDateTime(2023, 1, 15, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=-3)))
+
+        self.assertEqual(brt - utc, datetime.timedelta(hours=3))
+
+        with self.assertRaises(TypeError):
+            utc - SymmetricDateTime(2023, 1, 15, 10)
+
+    def test_holocene_add(self):
+        date_time = SymmetricDateTime(15_000, 6, 10, 23, holocene=True) + datetime.timedelta(hours=2)
+
+        self.assertTrue(date_time.is_holocene)
+        self.assertEqual((date_time.year, date_time.month, date_time.day, date_time.hour), (15_000, 6, 11, 1))
+
+        date_time = SymmetricDateTime(5_000, 1, 1, holocene=True) - datetime.timedelta(microseconds=1)
+
+        self.assertTrue(date_time.is_holocene)
+        self.assertEqual((date_time.year, date_time.month, date_time.day), (4_999, 12, 28))
+        self.assertEqual(date_time.time, datetime.time(23, 59, 59, 999_999))
+
+
+class TestSymmetricDateTimeTimeZone(unittest.TestCase):
+    def test_tzinfo_is_kept(self):
+        brt = datetime.timezone(datetime.timedelta(hours=-3), 'BRT')
+        other = datetime.timezone(datetime.timedelta(hours=-3), 'Other')
+
+        SymmetricDateTime(2023, 1, 15, 10, tzinfo=brt)
+        date_time = SymmetricDateTime(2023, 1, 15, 10, tzinfo=other)
+
+        self.assertIs(date_time.tzinfo, other)
+        self.assertEqual(date_time.strftime('%Z'), 'Other')
+
+    def test_equal_offsets_compare_by_fields(self):
+        brt = SymmetricDateTime(2023, 1, 15, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=-3), 'BRT'))
+        other = SymmetricDateTime(2023, 1, 15, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=-3), 'Other'))
+
+        self.assertEqual(brt, other)
+        self.assertLess(brt, other + datetime.timedelta(microseconds=1))
+
+
+class TestSymmetricDateTimeComparison(unittest.TestCase):
+    def test_naive_and_aware_are_not_equal(self):
+        naive = SymmetricDateTime(2023, 1, 15, 10)
+        aware = SymmetricDateTime(2023, 1, 15, 10, tzinfo=datetime.timezone.utc)
+
+        self.assertNotEqual(naive, aware)
+        self.assertNotEqual(naive, aware.gregorian_date_time)
+        self.assertEqual(len({naive, aware}), 2)
+
+        with self.assertRaises(TypeError):
+            naive < aware
+
+    def test_equal_values_hash_the_same(self):
+        utc = SymmetricDateTime(2023, 1, 15, 13, tzinfo=datetime.timezone.utc)
+        brt = SymmetricDateTime(2023, 1, 15, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=-3)))
+        naive = SymmetricDateTime(2023, 1, 15, 10)
+
+        self.assertEqual(utc, brt)
+        self.assertEqual(hash(utc), hash(brt))
+        self.assertEqual(naive, naive.gregorian_date_time)
+        self.assertEqual(hash(naive), hash(naive.gregorian_date_time))
+        self.assertEqual(naive, SymmetricDateTime(12_023, 1, 15, 10, holocene=True))
+        self.assertEqual(hash(naive), hash(SymmetricDateTime(12_023, 1, 15, 10, holocene=True)))
+
+    def test_equal_values_hash_the_same_outside_python_date_range(self):
+        utc = SymmetricDateTime(5_000, 1, 15, 13, tzinfo=datetime.timezone.utc, holocene=True)
+        brt = SymmetricDateTime(5_000, 1, 15, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=-3)), holocene=True)
+
+        self.assertEqual(utc, brt)
+        self.assertEqual(hash(utc), hash(brt))
+
+
+@unittest.skipIf(np is None, 'requires NumPy')
+class TestSymmetricDateTimeArrays(unittest.TestCase):
+    def test_from_arrays(self):
+        date_times = SymmetricDateTime.from_arrays([2_023, 2_004], [1, 12], [15, 35], 10, [0, 30])
+
+        self.assertEqual(date_times.shape, (2,))
+        self.assertEqual(date_times[0], SymmetricDateTime(2_023, 1, 15, 10, 0))
+        self.assertEqual(date_times[1], SymmetricDateTime(2_004, 12, 35, 10, 30))
+
+    def test_from_arrays_builds_integer_fields(self):
+        date_time = SymmetricDateTime.from_arrays(np.array([2_023.0]), [1], [1])[0]
+
+        self.assertIs(type(date_time.year), int)
+        self.assertEqual(repr(date_time), 'SymmetricDateTime(2023, 1, 1, 0, 0)')
+
+    def test_from_arrays_out_of_range(self):
+        with self.assertRaises(ValueError):
+            SymmetricDateTime.from_arrays([2_023], [2], [36])
+
+        with self.assertRaises(ValueError):
+            SymmetricDateTime.from_arrays([9_999], [1], [1])
+
+    def test_fromtimestamps(self):
+        timestamps = [0, 1_673_784_000.5]
+        date_times = SymmetricDateTime.fromtimestamps(timestamps, datetime.timezone.utc)
+
+        for timestamp, date_time in zip(timestamps, date_times):
+            self.assertEqual(date_time, SymmetricDateTime.fromtimestamp(timestamp, datetime.timezone.utc))
+
+    def test_fromtimestamps_out_of_range(self):
+        timestamp = datetime.datetime(9_999, 6, 1, tzinfo=datetime.timezone.utc).timestamp()
+
+        with self.assertRaises(ValueError):
+            SymmetricDateTime.fromtimestamps([timestamp])
+
+
+if __name__ == '__main__':
+    unittest.main()
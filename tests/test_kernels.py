@@ -0,0 +1,108 @@
+import importlib.util
+import os
+import unittest
+
+from unittest import mock
+
+import symmetric_calendar._kernels
+
+
+MAXORDINAL = 3_651_690
+HOLOCENE_EPOCH = -3_652_424
+CYCLE_DAYS = 107_016
+
+DAYS_BEFORE_MONTH = (-1, 0, 28, 63, 91, 119, 154, 182, 210, 245, 273, 301, 336)
+
+
+def _load_fallback_kernels():
+    "A separate copy of the kernels, always with the plain Python tables."
+    spec = importlib.util.spec_from_file_location('_fallback_kernels', symmetric_calendar._kernels.__file__)
+    module = importlib.util.module_from_spec(spec)
+
+    with mock.patch.dict(os.environ, {'SYMMETRIC_CALENDAR_NUMBA': '0'}):
+        spec.loader.exec_module(module)
+
+    return module
+
+
+#
+# The calendar’s own formulas, without tables or shortcuts
+#
+
+def _is_leap(year, holocene):
+    return 7 if (((year * 52) + (221 if holocene else 146)) % 293) < 52 else 0
+
+
+def _days_before_year(year, holocene):
+    year -= 1
+    return (364 * year) + (7 * (((52 * year) + (221 if holocene else 146)) // 293))
+
+
+def _ordinal_to_year_month_day(ordinal_date, holocene):
+    year = (((ordinal_date - 1) * 293) // CYCLE_DAYS) + 1
+
+    while _days_before_year(year, False) >= ordinal_date:
+        year -= 1
+
+    while _days_before_year(year + 1, False) < ordinal_date:
+        year += 1
+
+    day_in_year = ordinal_date - _days_before_year(year, False)
+    month = 12
+
+    while DAYS_BEFORE_MONTH[month] >= day_in_year:
+        month -= 1
+
+    if holocene:
+        year += 10_000
+
+    return year, month, day_in_year - DAYS_BEFORE_MONTH[month], day_in_year, (day_in_year + 6) // 7
+
+
+class TestFallbackKernels(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.kernels = _load_fallback_kernels()
+
+    def test_is_fallback(self):
+        self.assertFalse(self.kernels.NUMBA)
+
+    def test_is_leap(self):
+        for holocene in (False, True):
+            for year in range(-10_050, 20_051):
+                self.assertEqual(self.kernels._is_leap(year, holocene), _is_leap(year, holocene), (year, holocene))
+
+    def test_days_before_year(self):
+        for holocene in (False, True):
+            for year in range(-10_050, 20_051):
+                self.assertEqual(self.kernels._days_before_year(year, holocene), _days_before_year(year, holocene), (year, holocene))
+
+    def test_year_month_day_to_ordinal(self):
+        for year in (1, 2_004, 2_023, 9_998):
+            for month in range(1, 13):
+                for day in (1, 28):
+                    self.assertEqual(
+                        self.kernels._year_month_day_to_ordinal(year, month, day, False),
+                        _days_before_year(year, False) + DAYS_BEFORE_MONTH[month] + day,
+                    )
+
+    def test_ordinal_to_year_month_day(self):
+        #
+        # Every day of a whole cycle on both sides of the epoch,
+        # and then the whole range, Holocene included, by steps
+        #
+        ordinal_dates = list(range(-CYCLE_DAYS, CYCLE_DAYS + 1))
+        ordinal_dates += range(HOLOCENE_EPOCH - 1_000, MAXORDINAL + 1_000, 97)
+        ordinal_dates += range(MAXORDINAL - CYCLE_DAYS, MAXORDINAL + 1)
+
+        for holocene in (False, True):
+            for ordinal_date in ordinal_dates:
+                self.assertEqual(
+                    self.kernels._ordinal_to_year_month_day(ordinal_date, holocene),
+                    _ordinal_to_year_month_day(ordinal_date, holocene),
+                    (ordinal_date, holocene),
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()